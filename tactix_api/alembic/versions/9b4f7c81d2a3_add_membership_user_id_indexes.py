@@ -0,0 +1,34 @@
+"""Add user_id-leading indexes on membership association tables
+
+Revision ID: 9b4f7c81d2a3
+Revises:
+Create Date: 2026-08-27 10:12:45.301842
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b4f7c81d2a3'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_project_members_user_id",
+        "project_members",
+        ["user_id", "project_id"],
+    )
+    op.create_index(
+        "ix_workspace_members_user_id",
+        "workspace_members",
+        ["user_id", "workspace_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workspace_members_user_id", table_name="workspace_members")
+    op.drop_index("ix_project_members_user_id", table_name="project_members")
@@ -0,0 +1,34 @@
+"""Add indexes on frequently filtered project/task columns
+
+Revision ID: c6e2d5a09f18
+Revises: 9b4f7c81d2a3
+Create Date: 2026-08-27 10:41:07.584216
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e2d5a09f18'
+down_revision = '9b4f7c81d2a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_projects_workspace_id", "projects", ["workspace_id"])
+    op.create_index("ix_tasks_project_id", "tasks", ["project_id"])
+    op.create_index("ix_tasks_assignee_id", "tasks", ["assignee_id"])
+    op.create_index("ix_tasks_created_by_id", "tasks", ["created_by_id"])
+    op.create_index("ix_tasks_status", "tasks", ["status"])
+    op.create_index("ix_tasks_project_status", "tasks", ["project_id", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_project_status", table_name="tasks")
+    op.drop_index("ix_tasks_status", table_name="tasks")
+    op.drop_index("ix_tasks_created_by_id", table_name="tasks")
+    op.drop_index("ix_tasks_assignee_id", table_name="tasks")
+    op.drop_index("ix_tasks_project_id", table_name="tasks")
+    op.drop_index("ix_projects_workspace_id", table_name="projects")
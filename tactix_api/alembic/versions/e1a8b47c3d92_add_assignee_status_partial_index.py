@@ -0,0 +1,35 @@
+"""Add partial (assignee_id, status) index on tasks
+
+Revision ID: e1a8b47c3d92
+Revises: c6e2d5a09f18
+Create Date: 2026-08-27 15:23:51.118437
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1a8b47c3d92'
+down_revision = 'c6e2d5a09f18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial: "my tasks with status Y" never matches unassigned rows, so
+    # excluding assignee_id IS NULL keeps the index small. The remaining
+    # filter paths from this round are already covered: workspace_id and
+    # (project_id, status) by c6e2d5a09f18, (user_id, project_id) on
+    # project_members by 9b4f7c81d2a3.
+    op.create_index(
+        "ix_tasks_assignee_status",
+        "tasks",
+        ["assignee_id", "status"],
+        postgresql_where=sa.text("assignee_id IS NOT NULL"),
+        sqlite_where=sa.text("assignee_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_assignee_status", table_name="tasks")
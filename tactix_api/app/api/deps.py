@@ -1,15 +1,18 @@
-from typing import Generator, Optional
+from typing import AsyncGenerator, Generator, Optional, Set
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
+from sqlalchemy import select, union_all
 from sqlalchemy.orm import Session
 
 from app.core.auth import verify_password
 from app.core.config import settings
-from app.core.database import SessionLocal
+from app.core.database import SessionLocal, get_async_sessionmaker
+from app.models.project import project_members
 from app.models.user import User
+from app.models.workspace import Workspace, workspace_members
 from app.schemas.token import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
@@ -23,6 +26,17 @@ def get_db() -> Generator:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator:
+    """Async session for read-heavy endpoints.
+
+    Unlike the sync dependency, handlers using this run directly on the event
+    loop instead of occupying a threadpool slot for the duration of a DB wait.
+    """
+    session_factory = get_async_sessionmaker()
+    async with session_factory() as db:
+        yield db
+
+
 def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
     try:
         payload = jwt.decode(
@@ -47,4 +61,64 @@ def get_current_active_superuser(current_user: User = Depends(get_current_user))
         raise HTTPException(
             status_code=403, detail="The user doesn't have enough privileges"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+def get_perm_cache() -> dict:
+    """Fresh per-request memo for permission checks.
+
+    FastAPI caches dependency results for the lifetime of a request, so every
+    handler and sub-dependency depending on this shares one dict. Pass it as
+    the ``perm_cache`` argument of the service-layer access helpers so the
+    same (entity, id, user) probe is computed at most once per request.
+    """
+    return {}
+
+
+def get_accessible_workspace_ids(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Set[int]:
+    """Workspace ids the current user owns or is a member of.
+
+    FastAPI caches dependency results for the lifetime of a request, so
+    every handler (and sub-dependency) sharing this dependency reuses one
+    query instead of re-running workspace lookups and membership checks.
+    """
+    rows = db.execute(
+        union_all(
+            select(Workspace.id).where(Workspace.owner_id == current_user.id),
+            select(workspace_members.c.workspace_id).where(
+                workspace_members.c.user_id == current_user.id
+            ),
+        )
+    )
+    return {row[0] for row in rows}
+
+
+def is_workspace_member(db: Session, workspace_id: int, user_id: int) -> bool:
+    """Check workspace membership with a single SQL EXISTS probe.
+
+    Avoids loading the whole members collection just to run an ``in`` check;
+    the database short-circuits at the first matching row and returns a bool.
+    """
+    return db.query(
+        db.query(workspace_members)
+        .filter(
+            workspace_members.c.workspace_id == workspace_id,
+            workspace_members.c.user_id == user_id,
+        )
+        .exists()
+    ).scalar()
+
+
+def is_project_member(db: Session, project_id: int, user_id: int) -> bool:
+    """Check project membership with a single SQL EXISTS probe."""
+    return db.query(
+        db.query(project_members)
+        .filter(
+            project_members.c.project_id == project_id,
+            project_members.c.user_id == user_id,
+        )
+        .exists()
+    ).scalar()
\ No newline at end of file
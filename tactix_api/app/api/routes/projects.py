@@ -1,53 +1,114 @@
-from typing import Any, List
+from typing import Any, Optional, Set
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi_cache.decorator import cache
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from app.api import deps
-from app.models.project import Project
+from app.core.cache import entity_key_builder, invalidate
+from app.core.responses import ORJSONResponse
+from app.models.project import Project, project_members
 from app.models.user import User
-from app.models.workspace import Workspace
+from app.models.workspace import Workspace, workspace_members
 from app.schemas.project import (
     Project as ProjectSchema,
     ProjectCreate,
+    ProjectPage,
     ProjectUpdate,
     ProjectWithMembers,
 )
+from app.utils.helpers import decode_cursor, encode_cursor
 
 router = APIRouter()
 
+# The list response only exposes scalar columns, so select exactly those
+# instead of hydrating full ORM objects and their relationships.
+_PROJECT_LIST_COLUMNS = (
+    Project.id,
+    Project.name,
+    Project.description,
+    Project.workspace_id,
+    Project.created_at,
+    Project.updated_at,
+)
 
-@router.get("/", response_model=List[ProjectSchema])
-def read_projects(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
+# Built once at import; handlers only chain filters and bind parameters onto
+# it, so the engine's compiled-statement cache gets a stable cache key and the
+# per-request construction cost disappears.
+_PROJECT_LIST_STMT = select(*_PROJECT_LIST_COLUMNS)
+
+# Compiled once at import; serializing through it and returning ORJSONResponse
+# directly skips FastAPI's per-request response_model re-validation.
+_PROJECT_LIST_ADAPTER = TypeAdapter(list[ProjectSchema])
+
+
+def _apply_access_filter(stmt, current_user: User):
+    """Restrict a project select to rows the user may see.
+
+    Superusers pass through unchanged, so both branches of the list endpoint
+    share the same statement pipeline (eager options, cursor, serialization).
+    Accessible projects are those where the user is a member directly or via
+    the workspace; a UNION of three single-purpose subqueries lets each leg
+    use its own index, unlike an OR of correlated EXISTS.
+    """
+    if current_user.is_superuser:
+        return stmt
+    accessible_project_ids = union_all(
+        select(project_members.c.project_id).where(
+            project_members.c.user_id == current_user.id
+        ),
+        select(Project.id)
+        .join(Workspace)
+        .where(Workspace.owner_id == current_user.id),
+        select(Project.id)
+        .join(Workspace)
+        .join(
+            workspace_members,
+            Workspace.id == workspace_members.c.workspace_id,
+        )
+        .where(workspace_members.c.user_id == current_user.id),
+    )
+    return stmt.where(Project.id.in_(accessible_project_ids))
+
+
+@router.get("/", response_model=ProjectPage)
+async def read_projects(
+    db: AsyncSession = Depends(deps.get_async_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
     workspace_id: int = None,
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """
     Retrieve projects. Users can only see projects they have access to.
+
+    Pages are keyed by an opaque cursor over the monotonic id instead of an
+    OFFSET, so fetching a deep page no longer scans and discards skipped rows.
     """
-    if current_user.is_superuser:
-        query = db.query(Project)
-        if workspace_id:
-            query = query.filter(Project.workspace_id == workspace_id)
-        projects = query.offset(skip).limit(limit).all()
-    else:
-        # Get projects where user is a member or in a workspace where user is a member/owner
-        query = (
-            db.query(Project)
-            .join(Workspace)
-            .filter(
-                (Project.members.any(User.id == current_user.id))
-                | (Workspace.owner_id == current_user.id)
-                | (Workspace.members.any(User.id == current_user.id))
-            )
-        )
-        if workspace_id:
-            query = query.filter(Project.workspace_id == workspace_id)
-        projects = query.offset(skip).limit(limit).all()
-    return projects
+    stmt = _apply_access_filter(_PROJECT_LIST_STMT, current_user)
+    if workspace_id:
+        stmt = stmt.where(Project.workspace_id == workspace_id)
+    if cursor:
+        try:
+            cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        stmt = stmt.where(Project.id > cursor_id)
+    stmt = stmt.order_by(Project.id).limit(limit)
+    rows = (await db.execute(stmt)).all()
+    next_cursor = encode_cursor(rows[-1].id) if rows and len(rows) == limit else None
+    # Rows come straight from our own column select; construct instead of
+    # re-running the validator chain over data the DB schema already enforces.
+    items = [ProjectSchema.from_orm_fast(row) for row in rows]
+    return ORJSONResponse(
+        {
+            "items": _PROJECT_LIST_ADAPTER.dump_python(items, mode="json"),
+            "next_cursor": next_cursor,
+        }
+    )
 
 
 @router.post("/", response_model=ProjectSchema)
@@ -56,19 +117,19 @@ def create_project(
     db: Session = Depends(deps.get_db),
     project_in: ProjectCreate,
     current_user: User = Depends(deps.get_current_user),
+    accessible_workspace_ids: Set[int] = Depends(deps.get_accessible_workspace_ids),
 ) -> Any:
     """
     Create new project.
     """
     # Check if workspace exists and user has access
-    workspace = db.query(Workspace).filter(Workspace.id == project_in.workspace_id).first()
+    workspace = db.get(Workspace, project_in.workspace_id)
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
-    
-    if not (current_user.is_superuser or workspace.owner_id == current_user.id or 
-            current_user in workspace.members):
+
+    if not (current_user.is_superuser or workspace.id in accessible_workspace_ids):
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    
+
     project = Project(**project_in.dict())
     project.members.append(current_user)  # Add creator as a member
     db.add(project)
@@ -78,26 +139,36 @@ def create_project(
 
 
 @router.get("/{project_id}", response_model=ProjectWithMembers)
+@cache(expire=60, key_builder=entity_key_builder("project", "project_id"))
 def read_project(
     *,
     db: Session = Depends(deps.get_db),
     project_id: int,
     current_user: User = Depends(deps.get_current_user),
+    accessible_workspace_ids: Set[int] = Depends(deps.get_accessible_workspace_ids),
 ) -> Any:
     """
-    Get project by ID.
+    Get project by ID. Responses are cached briefly and invalidated on writes.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = (
+        db.query(Project)
+        .options(selectinload(Project.members))
+        .filter(Project.id == project_id)
+        .first()
+    )
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Check if user has access to this project
-    workspace = db.query(Workspace).filter(Workspace.id == project.workspace_id).first()
-    if not (current_user.is_superuser or workspace.owner_id == current_user.id or 
-            current_user in workspace.members or current_user in project.members):
+
+    # Check if user has access to this project; the accessible-workspace set
+    # already covers both ownership and workspace membership.
+    if not (current_user.is_superuser or
+            project.workspace_id in accessible_workspace_ids or
+            deps.is_project_member(db, project_id, current_user.id)):
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    
-    return project
+
+    # Return the schema rather than the ORM object so the cache stores a
+    # stable, fully loaded representation.
+    return ProjectWithMembers.model_validate(project)
 
 
 @router.put("/{project_id}", response_model=ProjectSchema)
@@ -111,22 +182,22 @@ def update_project(
     """
     Update a project.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Check if user has access to update this project
-    workspace = db.query(Workspace).filter(Workspace.id == project.workspace_id).first()
+    workspace = db.get(Workspace, project.workspace_id)
     if not (current_user.is_superuser or workspace.owner_id == current_user.id):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
     update_data = project_in.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(project, field, value)
-    
-    db.add(project)
+
+    # The instance is already in the session; no add/refresh round trip needed.
     db.commit()
-    db.refresh(project)
+    invalidate("project", project_id)
     return project
 
 
@@ -140,17 +211,18 @@ def delete_project(
     """
     Delete a project.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Check if user has access to delete this project
-    workspace = db.query(Workspace).filter(Workspace.id == project.workspace_id).first()
+    workspace = db.get(Workspace, project.workspace_id)
     if not (current_user.is_superuser or workspace.owner_id == current_user.id):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
     db.delete(project)
     db.commit()
+    invalidate("project", project_id)
     return project
 
 
@@ -165,27 +237,37 @@ def add_project_member(
     """
     Add a member to the project.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Check if user has access to add members
-    workspace = db.query(Workspace).filter(Workspace.id == project.workspace_id).first()
+    workspace = db.get(Workspace, project.workspace_id)
     if not (current_user.is_superuser or workspace.owner_id == current_user.id):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    if user in project.members:
+    # Membership changes go straight to the association table; appending to
+    # project.members would first load the whole collection just to add a row.
+    if deps.is_project_member(db, project_id, user_id):
         raise HTTPException(status_code=400, detail="User already in project")
-    
-    project.members.append(user)
-    db.add(project)
+
+    db.execute(
+        insert(project_members).values(project_id=project_id, user_id=user_id)
+    )
     db.commit()
-    db.refresh(project)
-    return project
+    invalidate("project", project_id)
+    # Reload with the members collection batched in, instead of refresh()
+    # re-selecting every column and then lazy-loading members again.
+    return (
+        db.query(Project)
+        .options(selectinload(Project.members))
+        .filter(Project.id == project_id)
+        .first()
+    )
 
 
 @router.delete("/{project_id}/members/{user_id}", response_model=ProjectWithMembers)
@@ -199,24 +281,35 @@ def remove_project_member(
     """
     Remove a member from the project.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Check if user has access to remove members
-    workspace = db.query(Workspace).filter(Workspace.id == project.workspace_id).first()
+    workspace = db.get(Workspace, project.workspace_id)
     if not (current_user.is_superuser or workspace.owner_id == current_user.id):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    if user not in project.members:
+    # Delete the association row directly rather than loading the members
+    # collection to remove one entry from it.
+    if not deps.is_project_member(db, project_id, user_id):
         raise HTTPException(status_code=400, detail="User not in project")
-    
-    project.members.remove(user)
-    db.add(project)
+
+    db.execute(
+        delete(project_members).where(
+            project_members.c.project_id == project_id,
+            project_members.c.user_id == user_id,
+        )
+    )
     db.commit()
-    db.refresh(project)
-    return project
\ No newline at end of file
+    invalidate("project", project_id)
+    return (
+        db.query(Project)
+        .options(selectinload(Project.members))
+        .filter(Project.id == project_id)
+        .first()
+    )
\ No newline at end of file
@@ -1,11 +1,18 @@
-from typing import Any, List
+from typing import Any, List, Set
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi_cache.decorator import cache
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from app.api import deps
+from app.core.cache import entity_key_builder, invalidate
+from app.core.config import settings
+from app.core.responses import ORJSONResponse
 from app.models.user import User
-from app.models.workspace import Workspace
+from app.models.workspace import Workspace, workspace_members
 from app.schemas.workspace import (
     Workspace as WorkspaceSchema,
     WorkspaceCreate,
@@ -15,10 +22,42 @@ from app.schemas.workspace import (
 
 router = APIRouter()
 
+# Compiled once at import; serializing through it and returning ORJSONResponse
+# directly skips FastAPI's per-request response_model re-validation.
+_WORKSPACE_LIST_ADAPTER = TypeAdapter(List[WorkspaceSchema])
+
+# WorkspaceSchema serializes scalar columns only, so the list select hydrates
+# nothing beyond the workspace rows themselves -- no relationship loads at all.
+_WORKSPACE_LIST_OPTS = ()
+if settings.ENVIRONMENT != "production":
+    # Fail loudly if serialization ever touches a relationship
+    # (N+1 regression guard).
+    _WORKSPACE_LIST_OPTS = (raiseload("*"),)
+
+# Built once at import; handlers only chain filters and bind parameters onto
+# it, so the engine's compiled-statement cache gets a stable cache key and the
+# per-request construction cost disappears.
+_WORKSPACE_LIST_STMT = select(Workspace).options(*_WORKSPACE_LIST_OPTS)
+
+
+def _apply_access_filter(stmt, current_user: User):
+    """Restrict a workspace select to rows the user may see.
+
+    Superusers pass through unchanged, so both branches of the list endpoint
+    share the same statement pipeline (eager options, serialization).
+    """
+    if current_user.is_superuser:
+        return stmt
+    # Workspaces where user is owner or member
+    return stmt.where(
+        (Workspace.owner_id == current_user.id)
+        | (Workspace.members.any(User.id == current_user.id))
+    )
+
 
 @router.get("/", response_model=List[WorkspaceSchema])
-def read_workspaces(
-    db: Session = Depends(deps.get_db),
+async def read_workspaces(
+    db: AsyncSession = Depends(deps.get_async_db),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_user),
@@ -26,21 +65,15 @@ def read_workspaces(
     """
     Retrieve workspaces. Users can only see workspaces they are members of or own.
     """
-    if current_user.is_superuser:
-        workspaces = db.query(Workspace).offset(skip).limit(limit).all()
-    else:
-        # Get workspaces where user is owner or member
-        workspaces = (
-            db.query(Workspace)
-            .filter(
-                (Workspace.owner_id == current_user.id)
-                | (Workspace.members.any(User.id == current_user.id))
-            )
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-    return workspaces
+    stmt = _apply_access_filter(_WORKSPACE_LIST_STMT, current_user)
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    # Rows come straight from our own eager-loaded select; construct instead
+    # of re-running the validator chain over data the DB schema enforces.
+    workspaces = [
+        WorkspaceSchema.from_orm_fast(workspace)
+        for workspace in result.scalars().all()
+    ]
+    return ORJSONResponse(_WORKSPACE_LIST_ADAPTER.dump_python(workspaces, mode="json"))
 
 
 @router.post("/", response_model=WorkspaceSchema)
@@ -64,25 +97,33 @@ def create_workspace(
 
 
 @router.get("/{workspace_id}", response_model=WorkspaceWithMembers)
+@cache(expire=60, key_builder=entity_key_builder("workspace", "workspace_id"))
 def read_workspace(
     *,
     db: Session = Depends(deps.get_db),
     workspace_id: int,
     current_user: User = Depends(deps.get_current_user),
+    accessible_workspace_ids: Set[int] = Depends(deps.get_accessible_workspace_ids),
 ) -> Any:
     """
-    Get workspace by ID.
+    Get workspace by ID. Responses are cached briefly and invalidated on writes.
     """
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+    workspace = (
+        db.query(Workspace)
+        .options(joinedload(Workspace.owner), selectinload(Workspace.members))
+        .filter(Workspace.id == workspace_id)
+        .first()
+    )
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
-    
+
     # Check if user has access to this workspace
-    if not (current_user.is_superuser or workspace.owner_id == current_user.id or 
-            current_user in workspace.members):
+    if not (current_user.is_superuser or workspace_id in accessible_workspace_ids):
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    
-    return workspace
+
+    # Return the schema rather than the ORM object so the cache stores a
+    # stable, fully loaded representation.
+    return WorkspaceWithMembers.model_validate(workspace)
 
 
 @router.put("/{workspace_id}", response_model=WorkspaceSchema)
@@ -96,7 +137,7 @@ def update_workspace(
     """
     Update a workspace.
     """
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+    workspace = db.get(Workspace, workspace_id)
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
     
@@ -107,10 +148,10 @@ def update_workspace(
     update_data = workspace_in.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(workspace, field, value)
-    
-    db.add(workspace)
+
+    # The instance is already in the session; no add/refresh round trip needed.
     db.commit()
-    db.refresh(workspace)
+    invalidate("workspace", workspace_id)
     return workspace
 
 
@@ -124,7 +165,7 @@ def delete_workspace(
     """
     Delete a workspace.
     """
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+    workspace = db.get(Workspace, workspace_id)
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
     
@@ -134,6 +175,7 @@ def delete_workspace(
     
     db.delete(workspace)
     db.commit()
+    invalidate("workspace", workspace_id)
     return workspace
 
 
@@ -148,7 +190,7 @@ def add_workspace_member(
     """
     Add a member to the workspace.
     """
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+    workspace = db.get(Workspace, workspace_id)
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
     
@@ -156,18 +198,28 @@ def add_workspace_member(
     if not (current_user.is_superuser or workspace.owner_id == current_user.id):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    if user in workspace.members:
+    # Membership changes go straight to the association table; appending to
+    # workspace.members would first load the whole collection just to add a row.
+    if deps.is_workspace_member(db, workspace_id, user_id):
         raise HTTPException(status_code=400, detail="User already in workspace")
-    
-    workspace.members.append(user)
-    db.add(workspace)
+
+    db.execute(
+        insert(workspace_members).values(workspace_id=workspace_id, user_id=user_id)
+    )
     db.commit()
-    db.refresh(workspace)
-    return workspace
+    invalidate("workspace", workspace_id)
+    # Reload with the members collection batched in, instead of refresh()
+    # re-selecting every column and then lazy-loading members again.
+    return (
+        db.query(Workspace)
+        .options(selectinload(Workspace.members))
+        .filter(Workspace.id == workspace_id)
+        .first()
+    )
 
 
 @router.delete("/{workspace_id}/members/{user_id}", response_model=WorkspaceWithMembers)
@@ -181,7 +233,7 @@ def remove_workspace_member(
     """
     Remove a member from the workspace.
     """
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+    workspace = db.get(Workspace, workspace_id)
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
     
@@ -189,15 +241,26 @@ def remove_workspace_member(
     if not (current_user.is_superuser or workspace.owner_id == current_user.id):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    if user not in workspace.members:
+    # Delete the association row directly rather than loading the members
+    # collection to remove one entry from it.
+    if not deps.is_workspace_member(db, workspace_id, user_id):
         raise HTTPException(status_code=400, detail="User not in workspace")
-    
-    workspace.members.remove(user)
-    db.add(workspace)
+
+    db.execute(
+        delete(workspace_members).where(
+            workspace_members.c.workspace_id == workspace_id,
+            workspace_members.c.user_id == user_id,
+        )
+    )
     db.commit()
-    db.refresh(workspace)
-    return workspace
\ No newline at end of file
+    invalidate("workspace", workspace_id)
+    return (
+        db.query(Workspace)
+        .options(selectinload(Workspace.members))
+        .filter(Workspace.id == workspace_id)
+        .first()
+    )
\ No newline at end of file
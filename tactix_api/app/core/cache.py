@@ -0,0 +1,53 @@
+import anyio
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app.core.config import settings
+
+
+async def init_cache() -> None:
+    """Initialize the response-cache backend at application startup.
+
+    Uses Redis when REDIS_URL is configured so cache entries are shared
+    across workers, and falls back to a per-process in-memory backend
+    otherwise (dev/test).
+    """
+    if settings.REDIS_URL:
+        from fastapi_cache.backends.redis import RedisBackend
+        from redis import asyncio as aioredis
+
+        backend = RedisBackend(aioredis.from_url(settings.REDIS_URL))
+    else:
+        backend = InMemoryBackend()
+    FastAPICache.init(backend, prefix="tactix")
+
+
+def entity_key_builder(entity: str, id_param: str):
+    """Build cache keys like ``project:42:u7`` from endpoint arguments.
+
+    Keys are scoped per user so the permission checks inside the handler
+    body stay effective: a cache hit for one user never serves another.
+    """
+
+    def _builder(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None):
+        kwargs = kwargs or {}
+        # FastAPICache.clear() prepends the prefix to the namespace it is
+        # given, so stored keys must carry it too for invalidation to match.
+        prefix = FastAPICache.get_prefix()
+        return f"{prefix}:{entity}:{kwargs[id_param]}:u{kwargs['current_user'].id}"
+
+    return _builder
+
+
+def invalidate(entity: str, entity_id: int) -> None:
+    """Drop every cached response for one entity from a sync handler.
+
+    Clears by key prefix (all per-user variants). Sync handlers run in
+    FastAPI's threadpool, so the async clear call is dispatched back to
+    the event loop.
+
+    The namespace must not end in a separator: the Redis backend appends
+    ":*" to build its match pattern, so a trailing colon would produce
+    "entity:id::*" and never match the stored "entity:id:u<id>" keys.
+    """
+    anyio.from_thread.run(FastAPICache.clear, f"{entity}:{entity_id}", None)
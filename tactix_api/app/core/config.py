@@ -1,4 +1,5 @@
 import os
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import AnyHttpUrl, PostgresDsn, field_validator
@@ -21,9 +22,20 @@ class Settings(BaseSettings):
             return v
         raise ValueError(v)
 
+    @cached_property
+    def CORS_ORIGINS_STR(self) -> List[str]:
+        """CORS origins as plain strings, computed once per process."""
+        return [str(origin) for origin in self.BACKEND_CORS_ORIGINS]
+
     # Database
     DATABASE_URL: PostgresDsn
 
+    # Connection pool tuning. Size the pool to match web-worker concurrency:
+    # an undersized pool serializes requests behind connection acquisition.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
+
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
@@ -54,4 +66,14 @@ class Settings(BaseSettings):
         env_file = ".env"
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings singleton.
+
+    Instantiating Settings re-reads and re-validates the environment; caching
+    keeps that off any path that constructs settings per call.
+    """
+    return Settings()
+
+
+settings = get_settings()
\ No newline at end of file
@@ -1,18 +1,70 @@
-from sqlalchemy import create_engine
+from sqlalchemy import Table, create_engine
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+# pool_pre_ping drops dead connections before handing them out and
+# pool_recycle retires them before server-side idle timeouts; LIFO checkout
+# keeps recently-used (cache-warm) connections in rotation.
+engine = create_engine(
+    str(settings.DATABASE_URL),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_use_lifo=True,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# The async engine is created lazily: the asyncpg driver is only needed once
+# an async endpoint actually opens a session, so importing the app (tests,
+# alembic, tooling) works without it.
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    global _async_engine, _async_session_factory
+    if _async_session_factory is None:
+        _async_engine = create_async_engine(
+            str(settings.DATABASE_URL).replace(
+                "postgresql://", "postgresql+asyncpg://", 1
+            ),
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+        _async_session_factory = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
 
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def insert_ignore(db: Session, table: Table):
+    """INSERT into ``table`` skipping rows that violate a unique constraint.
+
+    Uses the native ON CONFLICT DO NOTHING of whichever dialect the session
+    is bound to (PostgreSQL in production, SQLite in tests), so idempotent
+    writes like membership inserts need no separate existence query.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return pg_insert(table).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        return sqlite_insert(table).on_conflict_do_nothing()
+    return table.insert()
\ No newline at end of file
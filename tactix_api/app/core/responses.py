@@ -0,0 +1,32 @@
+"""Shared orjson response class used as the application default."""
+from enum import Enum
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(obj: Any) -> Any:
+    # orjson handles str/int-backed enums natively; this catches any other
+    # Enum (and nothing else) rather than falling over with a TypeError.
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson.
+
+    Same as FastAPI's ORJSONResponse, plus OPT_NAIVE_UTC so the naive
+    datetimes our models store are emitted with an explicit +00:00 offset
+    instead of an ambiguous bare timestamp.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -8,25 +8,34 @@ from app.api.routes import (
     projects_router,
     tasks_router,
 )
+from app.core.cache import init_cache
 from app.core.config import settings
+from app.core.responses import ORJSONResponse
 
 app = FastAPI(
     title="Projectmgr",
     description="A backend system for project management",
     version="0.1.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    # orjson serializes responses several times faster than stdlib json.
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
+    allow_origins=settings.CORS_ORIGINS_STR,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
+@app.on_event("startup")
+async def startup() -> None:
+    await init_cache()
+
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to TactixAPI"}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Table, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -9,6 +9,9 @@ project_members = Table(
     Base.metadata,
     Column("project_id", Integer, ForeignKey("projects.id"), primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
+    # The composite PK leads with project_id, so user_id-driven membership
+    # probes (EXISTS filters in the list endpoints) need their own index.
+    Index("ix_project_members_user_id", "user_id", "project_id"),
 )
 
 
@@ -18,11 +21,11 @@ class Project(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    workspace_id = Column(Integer, ForeignKey("workspaces.id"), nullable=False)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id"), nullable=False, index=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     workspace = relationship("Workspace", back_populates="projects")
-    members = relationship("User", secondary=project_members, backref="projects")
+    members = relationship("User", secondary=project_members, back_populates="projects")
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
\ No newline at end of file
@@ -1,6 +1,6 @@
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Table, Text, func
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, Table, Text, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -26,15 +26,29 @@ class Task(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(Enum(TaskStatus), default=TaskStatus.TODO, nullable=False)
+    status = Column(Enum(TaskStatus), default=TaskStatus.TODO, nullable=False, index=True)
     priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False)
     due_date = Column(DateTime, nullable=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
-    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Covers the common "tasks in project X with status Y" filter.
+        Index("ix_tasks_project_status", "project_id", "status"),
+        # Covers "my tasks with status Y"; partial because unassigned rows
+        # (assignee_id IS NULL) are never matched by that filter.
+        Index(
+            "ix_tasks_assignee_status",
+            "assignee_id",
+            "status",
+            postgresql_where=assignee_id.isnot(None),
+            sqlite_where=assignee_id.isnot(None),
+        ),
+    )
+
     # Relationships
     project = relationship("Project", back_populates="tasks")
     assignee = relationship("User", foreign_keys=[assignee_id])
@@ -18,5 +18,19 @@ class User(Base):
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    # workspaces = relationship("Workspace", back_populates="owner")
+    # Declared explicitly (back_populates) so each side can carry its own
+    # lazy strategy. Nothing traverses user -> projects/workspaces today,
+    # so lazy="raise" makes any accidental (and unbounded) load explicit.
+    projects = relationship(
+        "Project",
+        secondary="project_members",
+        back_populates="members",
+        lazy="raise",
+    )
+    workspaces = relationship(
+        "Workspace",
+        secondary="workspace_members",
+        back_populates="members",
+        lazy="raise",
+    )
     # tasks = relationship("Task", back_populates="assignee")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Table, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -9,6 +9,9 @@ workspace_members = Table(
     Base.metadata,
     Column("workspace_id", Integer, ForeignKey("workspaces.id"), primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
+    # The composite PK leads with workspace_id, so user_id-driven membership
+    # probes (EXISTS filters in the list endpoints) need their own index.
+    Index("ix_workspace_members_user_id", "user_id", "workspace_id"),
 )
 
 
@@ -24,5 +27,5 @@ class Workspace(Base):
 
     # Relationships
     owner = relationship("User", foreign_keys=[owner_id])
-    members = relationship("User", secondary=workspace_members, backref="workspaces")
+    members = relationship("User", secondary=workspace_members, back_populates="workspaces")
     projects = relationship("Project", back_populates="workspace", cascade="all, delete-orphan")
\ No newline at end of file
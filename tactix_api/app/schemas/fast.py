@@ -0,0 +1,102 @@
+"""msgspec-based output schemas for serialization-heavy endpoints.
+
+These structs mirror the response side of the Pydantic schemas and exist
+purely to make encoding cheap: msgspec.Struct instances are slot-based
+(no per-object __dict__) and msgspec.json.encode writes them straight to
+bytes, skipping the model_dump -> json.dumps two-step. Pydantic stays in
+charge of request input, where its validators earn their keep; only
+trusted DB-backed output goes through this module.
+"""
+from datetime import datetime
+from typing import Any, Optional
+
+import msgspec
+from fastapi.responses import JSONResponse
+
+from app.models.task import TaskPriority, TaskStatus
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSONResponse that renders with msgspec.
+
+    Encodes structs, datetimes and (str, Enum) values natively in C, so
+    handlers can return structs without a dict round-trip.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
+
+
+class _FromORM(msgspec.Struct, frozen=True):
+    @classmethod
+    def from_orm(cls, obj) -> "_FromORM":
+        """Build the struct from a trusted ORM row.
+
+        Like the Pydantic from_orm_fast helpers, this skips validation:
+        use it only for rows the database schema already guarantees.
+        """
+        return cls(**{field: getattr(obj, field) for field in cls.__struct_fields__})
+
+
+class UserOut(_FromORM, frozen=True):
+    id: int
+    email: Optional[str] = None
+    username: Optional[str] = None
+    is_active: Optional[bool] = True
+    is_superuser: bool = False
+    full_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class WorkspaceOut(_FromORM, frozen=True):
+    id: int
+    owner_id: int
+    created_at: datetime
+    updated_at: datetime
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+
+class ProjectOut(_FromORM, frozen=True):
+    id: int
+    workspace_id: int
+    created_at: datetime
+    updated_at: datetime
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+
+class TaskOut(_FromORM, frozen=True):
+    id: int
+    project_id: int
+    created_by_id: int
+    created_at: datetime
+    updated_at: datetime
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    due_date: Optional[datetime] = None
+    assignee_id: Optional[int] = None
+
+
+class TaskPageOut(msgspec.Struct, frozen=True):
+    items: list[TaskOut]
+    next_cursor: Optional[str] = None
+
+
+class TaskSummary(msgspec.Struct, frozen=True):
+    """Compact task row for large listings.
+
+    Built positionally from a column-tuple select (see
+    TaskService.list_task_summaries), so no Task ORM object -- and no
+    per-row __dict__ -- is ever materialized.
+    """
+
+    id: int
+    title: Optional[str]
+    status: Optional[TaskStatus]
+    priority: Optional[TaskPriority]
+    due_date: Optional[datetime]
+    assignee_id: Optional[int]
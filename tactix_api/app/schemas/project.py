@@ -33,6 +33,17 @@ class ProjectInDBBase(ProjectBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> "ProjectInDBBase":
+        """Build the schema from a trusted ORM row, skipping validation.
+
+        model_construct bypasses the validator chain, so use this only for
+        rows the database schema already guarantees, never for client input.
+        """
+        return cls.model_construct(
+            **{field: getattr(obj, field) for field in cls.model_fields}
+        )
+
 
 # Additional properties to return via API
 class Project(ProjectInDBBase):
@@ -41,4 +52,10 @@ class Project(ProjectInDBBase):
 
 # Additional properties to return via API with members
 class ProjectWithMembers(Project):
-    members: List[User] = []
\ No newline at end of file
+    members: List[User] = []
+
+
+# A keyset-paginated page of projects
+class ProjectPage(BaseModel):
+    items: List[Project] = []
+    next_cursor: Optional[str] = None
\ No newline at end of file
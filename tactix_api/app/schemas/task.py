@@ -39,6 +39,17 @@ class TaskInDBBase(TaskBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> "TaskInDBBase":
+        """Build the schema from a trusted ORM row, skipping validation.
+
+        model_construct bypasses the validator chain, so use this only for
+        rows the database schema already guarantees, never for client input.
+        """
+        return cls.model_construct(
+            **{field: getattr(obj, field) for field in cls.model_fields}
+        )
+
 
 # Additional properties to return via API
 class Task(TaskInDBBase):
@@ -48,4 +59,10 @@ class Task(TaskInDBBase):
 # Additional properties to return via API with related data
 class TaskWithDetails(Task):
     assignee: Optional[User] = None
-    created_by: User
\ No newline at end of file
+    created_by: User
+
+
+# A keyset-paginated page of tasks
+class TaskPage(BaseModel):
+    items: list[Task] = []
+    next_cursor: Optional[str] = None
\ No newline at end of file
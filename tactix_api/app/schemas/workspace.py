@@ -32,6 +32,17 @@ class WorkspaceInDBBase(WorkspaceBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> "WorkspaceInDBBase":
+        """Build the schema from a trusted ORM row, skipping validation.
+
+        model_construct bypasses the validator chain, so use this only for
+        rows the database schema already guarantees, never for client input.
+        """
+        return cls.model_construct(
+            **{field: getattr(obj, field) for field in cls.model_fields}
+        )
+
 
 # Additional properties to return via API
 class Workspace(WorkspaceInDBBase):
@@ -1,11 +1,15 @@
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, insert, or_, select, update
+from sqlalchemy.orm import Session, selectinload
 
+from app.core.database import insert_ignore
 from app.models.project import Project, project_members
 from app.models.user import User
+from app.models.workspace import Workspace, workspace_members
 from app.schemas.project import ProjectCreate, ProjectUpdate
 from app.services.workspace_service import WorkspaceService
+from app.utils.helpers import fast_dump_set
 
 
 class ProjectService:
@@ -16,35 +20,62 @@ class ProjectService:
 
     @staticmethod
     def get_projects_by_workspace(
-        db: Session, workspace_id: int, skip: int = 0, limit: int = 100
+        db: Session,
+        workspace_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> list[Project]:
-        """Get projects in a workspace."""
-        return (
+        """Get projects in a workspace.
+
+        Prefer ``after_id`` (the id of the last project on the previous
+        page) over ``skip`` for deep pages: the id filter is an index range
+        scan, while OFFSET re-scans every skipped row.
+        """
+        # Batch-load members so ProjectWithMembers serialization does not
+        # lazy-load the collection once per row.
+        query = (
             db.query(Project)
+            .options(selectinload(Project.members))
             .filter(Project.workspace_id == workspace_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
         )
+        if after_id is not None:
+            query = query.filter(Project.id > after_id)
+        return query.order_by(Project.id).offset(skip).limit(limit).all()
 
     @staticmethod
     def get_projects_by_user(
-        db: Session, user_id: int, skip: int = 0, limit: int = 100
+        db: Session,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> list[Project]:
-        """Get projects where user is a member."""
-        return (
+        """Get projects where user is a member.
+
+        Prefer ``after_id`` over ``skip`` for deep pages; see
+        get_projects_by_workspace.
+        """
+        query = (
             db.query(Project)
+            .options(selectinload(Project.members))
             .join(project_members, Project.id == project_members.c.project_id)
             .filter(project_members.c.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
         )
+        if after_id is not None:
+            query = query.filter(Project.id > after_id)
+        return query.order_by(Project.id).offset(skip).limit(limit).all()
 
     @staticmethod
     def get_all_projects(db: Session, skip: int = 0, limit: int = 100) -> list[Project]:
         """Get all projects (superuser only)."""
-        return db.query(Project).offset(skip).limit(limit).all()
+        return (
+            db.query(Project)
+            .options(selectinload(Project.members))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
     @staticmethod
     def create_project(
@@ -55,18 +86,26 @@ class ProjectService:
         if not WorkspaceService.has_access(db, workspace_id, creator_id):
             return None
 
-        db_project = Project(
-            name=project.name,
-            description=project.description,
-            workspace_id=workspace_id,
+        # INSERT ... RETURNING folds the post-commit SELECT that db.refresh
+        # would issue into the insert itself. The creator membership row goes
+        # into the same transaction -- no add_member round-trips re-checking
+        # a project we just created and access we just verified, and a
+        # single commit.
+        db_project = db.scalars(
+            insert(Project)
+            .values(
+                name=project.name,
+                description=project.description,
+                workspace_id=workspace_id,
+            )
+            .returning(Project)
+        ).one()
+        db.execute(
+            project_members.insert().values(
+                project_id=db_project.id, user_id=creator_id
+            )
         )
-        db.add(db_project)
         db.commit()
-        db.refresh(db_project)
-        
-        # Add creator as a member
-        ProjectService.add_member(db, db_project.id, creator_id)
-        
         return db_project
 
     @staticmethod
@@ -74,16 +113,19 @@ class ProjectService:
         db: Session, project_id: int, project_update: ProjectUpdate
     ) -> Optional[Project]:
         """Update project information."""
-        db_project = db.query(Project).filter(Project.id == project_id).first()
-        if not db_project:
-            return None
-
-        update_data = project_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_project, field, value)
+        update_data = fast_dump_set(project_update)
+        if not update_data:
+            return db.get(Project, project_id)
 
+        # UPDATE ... RETURNING hands back the fresh row without a separate
+        # existence SELECT or db.refresh; no row means no such project.
+        db_project = db.scalars(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(**update_data)
+            .returning(Project)
+        ).one_or_none()
         db.commit()
-        db.refresh(db_project)
         return db_project
 
     @staticmethod
@@ -98,7 +140,12 @@ class ProjectService:
         return True
 
     @staticmethod
-    def add_member(db: Session, project_id: int, user_id: int) -> bool:
+    def add_member(
+        db: Session,
+        project_id: int,
+        user_id: int,
+        perm_cache: Optional[dict] = None,
+    ) -> bool:
         """Add a member to project."""
         # Check if project exists
         project = db.query(Project).filter(Project.id == project_id).first()
@@ -114,27 +161,48 @@ class ProjectService:
         if not WorkspaceService.has_access(db, project.workspace_id, user_id):
             return False
 
-        # Check if user is already a member
-        existing_member = (
-            db.query(project_members)
-            .filter(
-                project_members.c.project_id == project_id,
-                project_members.c.user_id == user_id,
+        # ON CONFLICT DO NOTHING makes the insert idempotent, so no separate
+        # already-a-member query is needed.
+        db.execute(
+            insert_ignore(db, project_members).values(
+                project_id=project_id, user_id=user_id
             )
-            .first()
         )
-        if existing_member:
-            return True  # Already a member
+        db.commit()
+        if perm_cache is not None:
+            perm_cache.pop(("project", project_id, user_id), None)
+        return True
 
-        # Add member
-        db.execute(
-            project_members.insert().values(project_id=project_id, user_id=user_id)
+    @staticmethod
+    def add_members_bulk(db: Session, project_id: int, user_ids: list[int]) -> int:
+        """Add many members in a single multi-row INSERT.
+
+        One statement replaces N add_member round-trips; rows for users who
+        are already members are skipped by ON CONFLICT DO NOTHING. Returns
+        the number of memberships actually created. Callers are expected to
+        have checked workspace access for the batch.
+        """
+        if not user_ids:
+            return 0
+
+        result = db.execute(
+            insert_ignore(db, project_members).values(
+                [
+                    {"project_id": project_id, "user_id": user_id}
+                    for user_id in user_ids
+                ]
+            )
         )
         db.commit()
-        return True
+        return result.rowcount
 
     @staticmethod
-    def remove_member(db: Session, project_id: int, user_id: int) -> bool:
+    def remove_member(
+        db: Session,
+        project_id: int,
+        user_id: int,
+        perm_cache: Optional[dict] = None,
+    ) -> bool:
         """Remove a member from project."""
         result = db.execute(
             project_members.delete().where(
@@ -143,30 +211,72 @@ class ProjectService:
             )
         )
         db.commit()
+        # A cached positive check is stale the moment the membership row goes.
+        if perm_cache is not None:
+            perm_cache.pop(("project", project_id, user_id), None)
         return result.rowcount > 0
 
     @staticmethod
     def is_member(db: Session, project_id: int, user_id: int) -> bool:
-        """Check if user is a member of project."""
-        member = (
-            db.query(project_members)
-            .filter(
-                project_members.c.project_id == project_id,
-                project_members.c.user_id == user_id,
+        """Check if user is a member of project.
+
+        SELECT EXISTS lets the database short-circuit on the first matching
+        row and return a bare boolean instead of marshaling a full row.
+        """
+        return bool(
+            db.scalar(
+                select(
+                    exists().where(
+                        project_members.c.project_id == project_id,
+                        project_members.c.user_id == user_id,
+                    )
+                )
             )
-            .first()
         )
-        return member is not None
 
     @staticmethod
-    def has_access(db: Session, project_id: int, user_id: int) -> bool:
-        """Check if user has access to project (member or workspace access)."""
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
-            return False
-        
-        # Check if user is project member or has workspace access
-        return (
-            ProjectService.is_member(db, project_id, user_id)
-            or WorkspaceService.has_access(db, project.workspace_id, user_id)
-        )
\ No newline at end of file
+    def has_access(
+        db: Session,
+        project_id: int,
+        user_id: int,
+        perm_cache: Optional[dict] = None,
+    ) -> bool:
+        """Check if user has access to project (member or workspace access).
+
+        One SELECT of three EXISTS probes replaces the previous
+        get_project -> is_member -> workspace owner/member chain of
+        round-trips on this hot authorization path. A missing project
+        still yields False, as before.
+
+        ``perm_cache`` is an optional request-scoped memo (see
+        deps.get_perm_cache): repeated checks for the same project and user
+        within one request skip the query entirely.
+        """
+        key = ("project", project_id, user_id)
+        if perm_cache is not None and key in perm_cache:
+            return perm_cache[key]
+        allowed = bool(
+            db.scalar(
+                select(
+                    or_(
+                        exists().where(
+                            project_members.c.project_id == project_id,
+                            project_members.c.user_id == user_id,
+                        ),
+                        exists().where(
+                            Project.id == project_id,
+                            Workspace.id == Project.workspace_id,
+                            Workspace.owner_id == user_id,
+                        ),
+                        exists().where(
+                            Project.id == project_id,
+                            workspace_members.c.workspace_id == Project.workspace_id,
+                            workspace_members.c.user_id == user_id,
+                        ),
+                    )
+                )
+            )
+        )
+        if perm_cache is not None:
+            perm_cache[key] = allowed
+        return allowed
\ No newline at end of file
@@ -1,11 +1,40 @@
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select, union_all, update
+from sqlalchemy.orm import Session, selectinload
 
+from app.models.project import Project, project_members
 from app.models.task import Task, TaskPriority, TaskStatus
 from app.models.user import User
+from app.models.workspace import Workspace, workspace_members
+from app.schemas.fast import TaskSummary
 from app.schemas.task import TaskCreate, TaskUpdate
 from app.services.project_service import ProjectService
+from app.utils.helpers import fast_dump_set
+
+
+def _accessible_project_ids(user_id: int):
+    """Select of project ids the user may act on.
+
+    Mirrors ProjectService.has_access (project member, workspace owner or
+    workspace member) as a composable subquery, so a mutation can fold the
+    authorization into its own WHERE clause instead of probing first.
+    """
+    return union_all(
+        select(project_members.c.project_id).where(
+            project_members.c.user_id == user_id
+        ),
+        select(Project.id)
+        .join(Workspace, Workspace.id == Project.workspace_id)
+        .where(Workspace.owner_id == user_id),
+        select(Project.id).where(
+            Project.workspace_id.in_(
+                select(workspace_members.c.workspace_id).where(
+                    workspace_members.c.user_id == user_id
+                )
+            )
+        ),
+    )
 
 
 class TaskService:
@@ -22,16 +51,33 @@ class TaskService:
         assignee_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> list[Task]:
-        """Get tasks in a project with optional filters."""
-        query = db.query(Task).filter(Task.project_id == project_id)
-        
+        """Get tasks in a project with optional filters.
+
+        Prefer ``after_id`` (the id of the last task on the previous page)
+        over ``skip`` for deep pages: the id filter is an index range scan
+        costing O(limit) at any depth, while OFFSET re-scans and discards
+        every skipped row.
+        """
+        # Batch-load assignee and creator so TaskWithDetails serialization
+        # does not lazy-load them once per row.
+        query = (
+            db.query(Task)
+            .options(
+                selectinload(Task.assignee), selectinload(Task.created_by)
+            )
+            .filter(Task.project_id == project_id)
+        )
+
         if status:
             query = query.filter(Task.status == status)
         if assignee_id:
             query = query.filter(Task.assignee_id == assignee_id)
-        
-        return query.offset(skip).limit(limit).all()
+        if after_id is not None:
+            query = query.filter(Task.id > after_id)
+
+        return query.order_by(Task.id).offset(skip).limit(limit).all()
 
     @staticmethod
     def get_tasks_by_assignee(
@@ -40,14 +86,27 @@ class TaskService:
         status: Optional[TaskStatus] = None,
         skip: int = 0,
         limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> list[Task]:
-        """Get tasks assigned to a user with optional status filter."""
-        query = db.query(Task).filter(Task.assignee_id == assignee_id)
-        
+        """Get tasks assigned to a user with optional status filter.
+
+        Prefer ``after_id`` over ``skip`` for deep pages; see
+        get_tasks_by_project.
+        """
+        query = (
+            db.query(Task)
+            .options(
+                selectinload(Task.assignee), selectinload(Task.created_by)
+            )
+            .filter(Task.assignee_id == assignee_id)
+        )
+
         if status:
             query = query.filter(Task.status == status)
-        
-        return query.offset(skip).limit(limit).all()
+        if after_id is not None:
+            query = query.filter(Task.id > after_id)
+
+        return query.order_by(Task.id).offset(skip).limit(limit).all()
 
     @staticmethod
     def get_tasks_by_user_access(
@@ -56,21 +115,61 @@ class TaskService:
         status: Optional[TaskStatus] = None,
         skip: int = 0,
         limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> list[Task]:
-        """Get tasks that user has access to (through project membership)."""
-        # Get all projects user has access to
-        user_projects = ProjectService.get_projects_by_user(db, user_id)
-        project_ids = [p.id for p in user_projects]
-        
-        if not project_ids:
-            return []
-        
-        query = db.query(Task).filter(Task.project_id.in_(project_ids))
-        
+        """Get tasks that user has access to (through project membership).
+
+        A single JOIN against project_members replaces the previous two-step
+        flow that hydrated every accessible Project just to collect ids for
+        an IN clause. The (user_id, project_id) index makes the join leg an
+        index-only scan. Prefer ``after_id`` over ``skip`` for deep pages;
+        see get_tasks_by_project.
+        """
+        query = (
+            db.query(Task)
+            .options(
+                selectinload(Task.assignee), selectinload(Task.created_by)
+            )
+            .join(project_members, Task.project_id == project_members.c.project_id)
+            .filter(project_members.c.user_id == user_id)
+        )
+
         if status:
             query = query.filter(Task.status == status)
-        
-        return query.offset(skip).limit(limit).all()
+        if after_id is not None:
+            query = query.filter(Task.id > after_id)
+
+        return query.order_by(Task.id).offset(skip).limit(limit).all()
+
+    @staticmethod
+    def list_task_summaries(
+        db: Session,
+        project_id: int,
+        status: Optional[TaskStatus] = None,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+    ) -> list[TaskSummary]:
+        """List compact task rows for a project without ORM objects.
+
+        Selects only the columns a summary listing needs and builds
+        TaskSummary structs positionally from the row tuples, so a
+        1000-row page allocates no Task instances, identity-map entries
+        or per-row __dict__s.
+        """
+        stmt = select(
+            Task.id,
+            Task.title,
+            Task.status,
+            Task.priority,
+            Task.due_date,
+            Task.assignee_id,
+        ).where(Task.project_id == project_id)
+        if status:
+            stmt = stmt.where(Task.status == status)
+        if after_id is not None:
+            stmt = stmt.where(Task.id > after_id)
+        stmt = stmt.order_by(Task.id).limit(limit)
+        return [TaskSummary(*row) for row in db.execute(stmt)]
 
     @staticmethod
     def get_all_tasks(
@@ -80,7 +179,9 @@ class TaskService:
         limit: int = 100,
     ) -> list[Task]:
         """Get all tasks (superuser only)."""
-        query = db.query(Task)
+        query = db.query(Task).options(
+            selectinload(Task.assignee), selectinload(Task.created_by)
+        )
         
         if status:
             query = query.filter(Task.status == status)
@@ -89,77 +190,114 @@ class TaskService:
 
     @staticmethod
     def create_task(
-        db: Session, task: TaskCreate, project_id: int, creator_id: int
+        db: Session,
+        task: TaskCreate,
+        project_id: int,
+        creator_id: int,
+        perm_cache: Optional[dict] = None,
     ) -> Optional[Task]:
         """Create a new task."""
         # Check if user has access to project
-        if not ProjectService.has_access(db, project_id, creator_id):
+        if not ProjectService.has_access(db, project_id, creator_id, perm_cache):
             return None
 
         # Validate assignee if provided
         if task.assignee_id:
-            assignee = db.query(User).filter(User.id == task.assignee_id).first()
+            assignee = db.get(User, task.assignee_id)
             if not assignee:
                 return None
             # Check if assignee has access to project
-            if not ProjectService.has_access(db, project_id, task.assignee_id):
+            if not ProjectService.has_access(
+                db, project_id, task.assignee_id, perm_cache
+            ):
                 return None
 
-        db_task = Task(
-            title=task.title,
-            description=task.description,
-            status=task.status or TaskStatus.TODO,
-            priority=task.priority or TaskPriority.MEDIUM,
-            due_date=task.due_date,
-            project_id=project_id,
-            assignee_id=task.assignee_id,
-            creator_id=creator_id,
-        )
-        db.add(db_task)
+        # INSERT ... RETURNING folds the post-commit SELECT that db.refresh
+        # would issue into the insert itself.
+        db_task = db.scalars(
+            insert(Task)
+            .values(
+                title=task.title,
+                description=task.description,
+                status=task.status or TaskStatus.TODO,
+                priority=task.priority or TaskPriority.MEDIUM,
+                due_date=task.due_date,
+                project_id=project_id,
+                assignee_id=task.assignee_id,
+                created_by_id=creator_id,
+            )
+            .returning(Task)
+        ).one()
         db.commit()
-        db.refresh(db_task)
         return db_task
 
     @staticmethod
     def update_task(
-        db: Session, task_id: int, task_update: TaskUpdate, user_id: int
+        db: Session,
+        task_id: int,
+        task_update: TaskUpdate,
+        user_id: int,
+        perm_cache: Optional[dict] = None,
     ) -> Optional[Task]:
-        """Update task information."""
-        db_task = db.query(Task).filter(Task.id == task_id).first()
-        if not db_task:
-            return None
+        """Update task information.
 
-        # Check if user has access to the task's project
-        if not ProjectService.has_access(db, db_task.project_id, user_id):
-            return None
+        The caller's authorization is folded into the UPDATE's WHERE clause
+        (task id plus accessible project ids), so the common path is a
+        single statement; no row back means missing task or no access,
+        both of which return None as before.
+        """
+        update_data = fast_dump_set(task_update)
 
-        update_data = task_update.model_dump(exclude_unset=True)
-        
-        # Validate assignee if being updated
-        if "assignee_id" in update_data and update_data["assignee_id"]:
-            assignee = db.query(User).filter(User.id == update_data["assignee_id"]).first()
+        # Validate assignee if being updated; this branch still needs the
+        # project id up front for the assignee's own access check.
+        if update_data.get("assignee_id"):
+            project_id = db.scalar(
+                select(Task.project_id).where(Task.id == task_id)
+            )
+            if project_id is None:
+                return None
+            assignee = db.get(User, update_data["assignee_id"])
             if not assignee:
                 return None
-            # Check if assignee has access to project
-            if not ProjectService.has_access(db, db_task.project_id, update_data["assignee_id"]):
+            if not ProjectService.has_access(
+                db, project_id, update_data["assignee_id"], perm_cache
+            ):
                 return None
 
-        for field, value in update_data.items():
-            setattr(db_task, field, value)
+        if not update_data:
+            return db.scalars(
+                select(Task).where(
+                    Task.id == task_id,
+                    Task.project_id.in_(_accessible_project_ids(user_id)),
+                )
+            ).one_or_none()
 
+        db_task = db.scalars(
+            update(Task)
+            .where(
+                Task.id == task_id,
+                Task.project_id.in_(_accessible_project_ids(user_id)),
+            )
+            .values(**update_data)
+            .returning(Task)
+        ).one_or_none()
         db.commit()
-        db.refresh(db_task)
         return db_task
 
     @staticmethod
-    def delete_task(db: Session, task_id: int, user_id: int) -> bool:
+    def delete_task(
+        db: Session,
+        task_id: int,
+        user_id: int,
+        perm_cache: Optional[dict] = None,
+    ) -> bool:
         """Delete a task."""
         db_task = db.query(Task).filter(Task.id == task_id).first()
         if not db_task:
             return False
 
         # Check if user has access to the task's project
-        if not ProjectService.has_access(db, db_task.project_id, user_id):
+        if not ProjectService.has_access(db, db_task.project_id, user_id, perm_cache):
             return False
 
         db.delete(db_task)
@@ -167,28 +305,40 @@ class TaskService:
         return True
 
     @staticmethod
-    def has_access(db: Session, task_id: int, user_id: int) -> bool:
-        """Check if user has access to task (through project access)."""
-        task = db.query(Task).filter(Task.id == task_id).first()
-        if not task:
+    def has_access(
+        db: Session,
+        task_id: int,
+        user_id: int,
+        perm_cache: Optional[dict] = None,
+    ) -> bool:
+        """Check if user has access to task (through project access).
+
+        Fetches only the project id rather than hydrating the whole Task;
+        the combined project/workspace check is a single further query.
+        """
+        project_id = db.scalar(select(Task.project_id).where(Task.id == task_id))
+        if project_id is None:
             return False
-        
-        return ProjectService.has_access(db, task.project_id, user_id)
+
+        return ProjectService.has_access(db, project_id, user_id, perm_cache)
 
     @staticmethod
     def update_task_status(
         db: Session, task_id: int, status: TaskStatus, user_id: int
     ) -> Optional[Task]:
-        """Update task status."""
-        db_task = db.query(Task).filter(Task.id == task_id).first()
-        if not db_task:
-            return None
-
-        # Check if user has access to the task's project
-        if not ProjectService.has_access(db, db_task.project_id, user_id):
-            return None
+        """Update task status.
 
-        db_task.status = status
+        A single UPDATE with the authorization folded into the WHERE clause;
+        no row back means missing task or no access, both None as before.
+        """
+        db_task = db.scalars(
+            update(Task)
+            .where(
+                Task.id == task_id,
+                Task.project_id.in_(_accessible_project_ids(user_id)),
+            )
+            .values(status=status)
+            .returning(Task)
+        ).one_or_none()
         db.commit()
-        db.refresh(db_task)
         return db_task
\ No newline at end of file
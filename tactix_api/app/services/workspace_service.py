@@ -1,10 +1,13 @@
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, insert, or_, select, union_all, update
+from sqlalchemy.orm import Session, selectinload
 
+from app.core.database import insert_ignore
 from app.models.user import User
 from app.models.workspace import Workspace, workspace_members
 from app.schemas.workspace import WorkspaceCreate, WorkspaceUpdate
+from app.utils.helpers import fast_dump_set
 
 
 class WorkspaceService:
@@ -14,40 +17,76 @@ class WorkspaceService:
         return db.query(Workspace).filter(Workspace.id == workspace_id).first()
 
     @staticmethod
-    def get_workspaces_by_user(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> list[Workspace]:
-        """Get workspaces where user is owner or member."""
-        return (
+    def get_workspaces_by_user(
+        db: Session,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+    ) -> list[Workspace]:
+        """Get workspaces where user is owner or member.
+
+        Prefer ``after_id`` (the id of the last workspace on the previous
+        page) over ``skip`` for deep pages: the id filter is an index range
+        scan, while OFFSET re-scans every skipped row.
+        """
+        # Each UNION branch is a simple id scan on its own index (owner_id
+        # and the membership table); the old join with an OR predicate plus
+        # DISTINCT forced a sort/unique pass over the joined rows instead.
+        accessible_ids = union_all(
+            select(Workspace.id).where(Workspace.owner_id == user_id),
+            select(workspace_members.c.workspace_id).where(
+                workspace_members.c.user_id == user_id
+            ),
+        )
+        # Batch-load owner and members so WorkspaceWithMembers serialization
+        # does not lazy-load them once per row.
+        query = (
             db.query(Workspace)
-            .join(workspace_members, Workspace.id == workspace_members.c.workspace_id)
-            .filter(
-                (Workspace.owner_id == user_id) | (workspace_members.c.user_id == user_id)
+            .options(
+                selectinload(Workspace.owner), selectinload(Workspace.members)
             )
-            .distinct()
-            .offset(skip)
-            .limit(limit)
-            .all()
+            .filter(Workspace.id.in_(accessible_ids))
         )
+        if after_id is not None:
+            query = query.filter(Workspace.id > after_id)
+        return query.order_by(Workspace.id).offset(skip).limit(limit).all()
 
     @staticmethod
     def get_all_workspaces(db: Session, skip: int = 0, limit: int = 100) -> list[Workspace]:
         """Get all workspaces (superuser only)."""
-        return db.query(Workspace).offset(skip).limit(limit).all()
+        return (
+            db.query(Workspace)
+            .options(
+                selectinload(Workspace.owner), selectinload(Workspace.members)
+            )
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
     @staticmethod
     def create_workspace(db: Session, workspace: WorkspaceCreate, owner_id: int) -> Workspace:
         """Create a new workspace."""
-        db_workspace = Workspace(
-            name=workspace.name,
-            description=workspace.description,
-            owner_id=owner_id,
+        # INSERT ... RETURNING folds the post-commit SELECT that db.refresh
+        # would issue into the insert itself. The owner membership row goes
+        # into the same transaction -- no add_member round-trips re-checking
+        # a workspace and user we just created from, and a single commit.
+        db_workspace = db.scalars(
+            insert(Workspace)
+            .values(
+                name=workspace.name,
+                description=workspace.description,
+                owner_id=owner_id,
+            )
+            .returning(Workspace)
+        ).one()
+        db.execute(
+            workspace_members.insert().values(
+                workspace_id=db_workspace.id, user_id=owner_id
+            )
         )
-        db.add(db_workspace)
         db.commit()
-        db.refresh(db_workspace)
-        
-        # Add owner as a member
-        WorkspaceService.add_member(db, db_workspace.id, owner_id)
-        
         return db_workspace
 
     @staticmethod
@@ -55,16 +94,19 @@ class WorkspaceService:
         db: Session, workspace_id: int, workspace_update: WorkspaceUpdate
     ) -> Optional[Workspace]:
         """Update workspace information."""
-        db_workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
-        if not db_workspace:
-            return None
-
-        update_data = workspace_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_workspace, field, value)
+        update_data = fast_dump_set(workspace_update)
+        if not update_data:
+            return db.get(Workspace, workspace_id)
 
+        # UPDATE ... RETURNING hands back the fresh row without a separate
+        # existence SELECT or db.refresh; no row means no such workspace.
+        db_workspace = db.scalars(
+            update(Workspace)
+            .where(Workspace.id == workspace_id)
+            .values(**update_data)
+            .returning(Workspace)
+        ).one_or_none()
         db.commit()
-        db.refresh(db_workspace)
         return db_workspace
 
     @staticmethod
@@ -79,7 +121,12 @@ class WorkspaceService:
         return True
 
     @staticmethod
-    def add_member(db: Session, workspace_id: int, user_id: int) -> bool:
+    def add_member(
+        db: Session,
+        workspace_id: int,
+        user_id: int,
+        perm_cache: Optional[dict] = None,
+    ) -> bool:
         """Add a member to workspace."""
         # Check if workspace exists
         workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
@@ -91,29 +138,47 @@ class WorkspaceService:
         if not user:
             return False
 
-        # Check if user is already a member
-        existing_member = (
-            db.query(workspace_members)
-            .filter(
-                workspace_members.c.workspace_id == workspace_id,
-                workspace_members.c.user_id == user_id,
-            )
-            .first()
-        )
-        if existing_member:
-            return True  # Already a member
-
-        # Add member
+        # ON CONFLICT DO NOTHING makes the insert idempotent, so no separate
+        # already-a-member query is needed.
         db.execute(
-            workspace_members.insert().values(
+            insert_ignore(db, workspace_members).values(
                 workspace_id=workspace_id, user_id=user_id
             )
         )
         db.commit()
+        if perm_cache is not None:
+            perm_cache.pop(("workspace", workspace_id, user_id), None)
         return True
 
     @staticmethod
-    def remove_member(db: Session, workspace_id: int, user_id: int) -> bool:
+    def add_members_bulk(db: Session, workspace_id: int, user_ids: list[int]) -> int:
+        """Add many members in a single multi-row INSERT.
+
+        One statement replaces N add_member round-trips; rows for users who
+        are already members are skipped by ON CONFLICT DO NOTHING. Returns
+        the number of memberships actually created.
+        """
+        if not user_ids:
+            return 0
+
+        result = db.execute(
+            insert_ignore(db, workspace_members).values(
+                [
+                    {"workspace_id": workspace_id, "user_id": user_id}
+                    for user_id in user_ids
+                ]
+            )
+        )
+        db.commit()
+        return result.rowcount
+
+    @staticmethod
+    def remove_member(
+        db: Session,
+        workspace_id: int,
+        user_id: int,
+        perm_cache: Optional[dict] = None,
+    ) -> bool:
         """Remove a member from workspace."""
         result = db.execute(
             workspace_members.delete().where(
@@ -122,20 +187,28 @@ class WorkspaceService:
             )
         )
         db.commit()
+        # A cached positive check is stale the moment the membership row goes.
+        if perm_cache is not None:
+            perm_cache.pop(("workspace", workspace_id, user_id), None)
         return result.rowcount > 0
 
     @staticmethod
     def is_member(db: Session, workspace_id: int, user_id: int) -> bool:
-        """Check if user is a member of workspace."""
-        member = (
-            db.query(workspace_members)
-            .filter(
-                workspace_members.c.workspace_id == workspace_id,
-                workspace_members.c.user_id == user_id,
+        """Check if user is a member of workspace.
+
+        SELECT EXISTS lets the database short-circuit on the first matching
+        row and return a bare boolean instead of marshaling a full row.
+        """
+        return bool(
+            db.scalar(
+                select(
+                    exists().where(
+                        workspace_members.c.workspace_id == workspace_id,
+                        workspace_members.c.user_id == user_id,
+                    )
+                )
             )
-            .first()
         )
-        return member is not None
 
     @staticmethod
     def is_owner(db: Session, workspace_id: int, user_id: int) -> bool:
@@ -144,9 +217,40 @@ class WorkspaceService:
         return workspace and workspace.owner_id == user_id
 
     @staticmethod
-    def has_access(db: Session, workspace_id: int, user_id: int) -> bool:
-        """Check if user has access to workspace (owner or member)."""
-        return (
-            WorkspaceService.is_owner(db, workspace_id, user_id)
-            or WorkspaceService.is_member(db, workspace_id, user_id)
-        )
\ No newline at end of file
+    def has_access(
+        db: Session,
+        workspace_id: int,
+        user_id: int,
+        perm_cache: Optional[dict] = None,
+    ) -> bool:
+        """Check if user has access to workspace (owner or member).
+
+        One SELECT of two EXISTS probes replaces the previous
+        is_owner + is_member pair of queries on this hot path.
+
+        ``perm_cache`` is an optional request-scoped memo (see
+        deps.get_perm_cache): repeated checks for the same workspace and
+        user within one request skip the query entirely.
+        """
+        key = ("workspace", workspace_id, user_id)
+        if perm_cache is not None and key in perm_cache:
+            return perm_cache[key]
+        allowed = bool(
+            db.scalar(
+                select(
+                    or_(
+                        exists().where(
+                            Workspace.id == workspace_id,
+                            Workspace.owner_id == user_id,
+                        ),
+                        exists().where(
+                            workspace_members.c.workspace_id == workspace_id,
+                            workspace_members.c.user_id == user_id,
+                        ),
+                    )
+                )
+            )
+        )
+        if perm_cache is not None:
+            perm_cache[key] = allowed
+        return allowed
\ No newline at end of file
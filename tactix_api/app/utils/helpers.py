@@ -1,19 +1,32 @@
+import base64
+import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import re
 
+# Compiled once at import; these run on every validation call, and going
+# through re.match(str, ...) repeats a pattern-cache dict lookup each time.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
 
 def is_valid_email(email: str) -> bool:
     """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def is_valid_username(username: str) -> bool:
-    """Validate username format (alphanumeric and underscores, 3-30 chars)."""
-    pattern = r'^[a-zA-Z0-9_]{3,30}$'
-    return re.match(pattern, username) is not None
+    """Validate username format (alphanumeric and underscores, 3-30 chars).
+
+    A plain character scan; the check is a single character class, so the
+    regex engine was pure overhead on this hot path. The isascii() guard
+    keeps isalnum() from accepting non-ASCII letters and digits.
+    """
+    if not 3 <= len(username) <= 30:
+        return False
+    return username.isascii() and all(c.isalnum() or c == "_" for c in username)
 
 
 def utc_now() -> datetime:
@@ -36,34 +49,76 @@ def sanitize_string(text: Optional[str], max_length: int = 255) -> Optional[str]
     return text if text else None
 
 
-def format_error_response(message: str, details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Format error response for API."""
+def format_error_response(
+    message: str,
+    details: Optional[Dict[str, Any]] = None,
+    now_iso: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Format error response for API.
+
+    Callers emitting several responses for one logical moment can pass a
+    precomputed ``now_iso`` instead of re-reading and re-formatting the
+    clock for each one.
+    """
     response = {
         "error": True,
         "message": message,
-        "timestamp": utc_now().isoformat()
+        "timestamp": now_iso or utc_now().isoformat()
     }
-    
+
     if details:
         response["details"] = details
-    
+
     return response
 
 
-def format_success_response(data: Any, message: Optional[str] = None) -> Dict[str, Any]:
-    """Format success response for API."""
+def format_success_response(
+    data: Any,
+    message: Optional[str] = None,
+    now_iso: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Format success response for API.
+
+    Callers emitting several responses for one logical moment can pass a
+    precomputed ``now_iso`` instead of re-reading and re-formatting the
+    clock for each one.
+    """
     response = {
         "success": True,
         "data": data,
-        "timestamp": utc_now().isoformat()
+        "timestamp": now_iso or utc_now().isoformat()
     }
-    
+
     if message:
         response["message"] = message
-    
+
     return response
 
 
+@lru_cache(maxsize=None)
+def _interned_field_names(model_cls) -> tuple:
+    """Interned field-name tuple for a Pydantic model class, computed once."""
+    return tuple(sys.intern(name) for name in model_cls.model_fields)
+
+
+def fast_dump_set(model) -> Dict[str, Any]:
+    """Extract the explicitly set fields of a Pydantic model as a dict.
+
+    Equivalent to ``model.model_dump(exclude_unset=True)`` for flat update
+    schemas, but walks a per-class interned field tuple and reads attributes
+    directly instead of running the generic dump machinery, so the hot
+    update paths skip its per-call field-set walk and string allocations.
+    Values come back unconverted (enums stay enums), which is what the
+    SQLAlchemy ``values()`` clauses want.
+    """
+    fields_set = model.__pydantic_fields_set__
+    return {
+        name: getattr(model, name)
+        for name in _interned_field_names(type(model))
+        if name in fields_set
+    }
+
+
 def paginate_query_params(skip: int = 0, limit: int = 100) -> tuple[int, int]:
     """Validate and normalize pagination parameters."""
     # Ensure skip is non-negative
@@ -75,13 +130,35 @@ def paginate_query_params(skip: int = 0, limit: int = 100) -> tuple[int, int]:
     return skip, limit
 
 
+def encode_cursor(item_id: int) -> str:
+    """Encode a keyset-pagination cursor for an id position.
+
+    The cursor seeks on the monotonic primary key alone. An earlier
+    (created_at, id) tuple cursor dropped rows that tied with the cursor
+    on created_at: SQLite stores second-precision timestamps but compared
+    them textually against the microsecond-formatted bound parameter.
+    """
+    return base64.urlsafe_b64encode(str(item_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises ValueError for malformed cursors.
+    """
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except ValueError as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
 def generate_slug(text: str) -> str:
     """Generate a URL-friendly slug from text."""
     # Convert to lowercase
     text = text.lower()
     
     # Replace spaces and special characters with hyphens
-    text = re.sub(r'[^a-z0-9]+', '-', text)
+    text = _SLUG_RE.sub('-', text)
     
     # Remove leading/trailing hyphens
     text = text.strip('-')
@@ -0,0 +1,31 @@
+"""Optional Cython build for the hot helper and service modules.
+
+Run ``python setup.py build_ext --inplace`` with Cython installed to compile
+the modules below to extension modules; CPython prefers the resulting .so
+over the .py at import time. Deployments that just ``pip install -r
+requirements.txt`` keep using the interpreted modules, and the .py sources
+stay in place for debugging either way.
+"""
+from setuptools import setup
+
+_COMPILED_MODULES = [
+    "app/utils/helpers.py",
+    "app/services/project_service.py",
+    "app/services/task_service.py",
+    "app/services/user_service.py",
+    "app/services/workspace_service.py",
+]
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(_COMPILED_MODULES, language_level=3)
+
+setup(
+    name="tactix-api",
+    version="0.1.0",
+    packages=[],
+    ext_modules=ext_modules,
+)
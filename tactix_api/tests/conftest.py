@@ -1,52 +1,200 @@
+import contextlib
+import os
+import tempfile
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
+from app.api import deps
+from app.core.auth import create_access_token
 from app.core.database import Base, get_db
 from app.main import app
-
-# Use in-memory SQLite for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.models.workspace import Workspace
+
+# Use a file-backed SQLite database for testing so the sync session used by
+# most handlers and the async session used by the list endpoints see the same
+# data. The file lives on tmpfs (/dev/shm) when available, so it is served
+# from RAM, and carries the pid plus the pytest-xdist worker id so parallel
+# workers never share a database.
+_TEST_DB_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+SQLALCHEMY_DATABASE_FILE = os.path.join(
+    _TEST_DB_DIR, f"tactix_test_{os.getpid()}_{_XDIST_WORKER}.db"
+)
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{SQLALCHEMY_DATABASE_FILE}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={
         "check_same_thread": False,
     },
-    poolclass=StaticPool,
 )
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{SQLALCHEMY_DATABASE_FILE}")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Trade durability for speed on every test connection.
+
+    WAL lets the sync and async engines read and write concurrently,
+    synchronous=OFF skips fsyncs (fine for throwaway test data), and the
+    temp-store/cache settings keep spills and pages in memory.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
+event.listen(engine, "connect", _set_sqlite_pragmas)
+event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncTestingSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database session for each test."""
+@pytest.fixture(scope="session")
+def _schema():
+    """Create the schema once for the whole test session."""
     Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(SQLALCHEMY_DATABASE_FILE + suffix)
+        except OSError:
+            pass
+
+
+@pytest.fixture(scope="function")
+def db_session(_schema):
+    """Create a database session for each test; rows are wiped at teardown.
+
+    The schema DDL now runs once per session instead of once per test.
+    Isolation is row-level (one DELETE per table in reverse FK order)
+    rather than a rolled-back SAVEPOINT because seeded data must be
+    genuinely committed for the async engine -- a separate connection --
+    to see it.
+    """
     session = TestingSessionLocal()
     try:
         yield session
     finally:
+        session.rollback()
+        for table in reversed(Base.metadata.sorted_tables):
+            session.execute(table.delete())
+        session.commit()
         session.close()
-        Base.metadata.drop_all(bind=engine)
 
 
 @pytest.fixture(scope="function")
 def client(db_session):
-    """Create a test client with database session override."""
+    """Create a test client with database session overrides."""
     def override_get_db():
         try:
             yield db_session
         finally:
             pass
 
+    async def override_get_async_db():
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+
+    # Handlers depend on deps.get_db, which wraps its own SessionLocal;
+    # override both it and the core get_db so nothing reaches the real engine.
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[deps.get_db] = override_get_db
+    app.dependency_overrides[deps.get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def assert_max_queries():
+    """Context manager asserting at most ``n`` SQL statements are executed.
+
+    Counts ``before_cursor_execute`` events on both test engines so N+1
+    regressions on either the sync or the async request path fail loudly.
+    """
+    @contextlib.contextmanager
+    def _assert_max_queries(n):
+        statements = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _count)
+        event.listen(async_engine.sync_engine, "before_cursor_execute", _count)
+        try:
+            yield
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+            event.remove(
+                async_engine.sync_engine, "before_cursor_execute", _count
+            )
+        assert len(statements) <= n, (
+            f"Expected at most {n} queries, got {len(statements)}:\n"
+            + "\n".join(statements)
+        )
+
+    return _assert_max_queries
+
+
+@pytest.fixture
+def seed_owner(db_session):
+    """Factory: a workspace owner with projects and tasks spread across them.
+
+    Everything is inserted within the same second on purpose: tying
+    created_at values are exactly what a broken cursor predicate drops.
+    """
+    def _seed(projects=10, tasks_per_project=10):
+        user = User(
+            email="owner@example.com",
+            username="owner",
+            hashed_password="not-a-real-hash",
+        )
+        db_session.add(user)
+        db_session.commit()
+
+        workspace = Workspace(name="Workspace", owner_id=user.id)
+        db_session.add(workspace)
+        db_session.commit()
+
+        for p in range(projects):
+            project = Project(name=f"Project {p}", workspace_id=workspace.id)
+            db_session.add(project)
+            db_session.commit()
+            for t in range(tasks_per_project):
+                db_session.add(
+                    Task(
+                        title=f"Task {p}-{t}",
+                        project_id=project.id,
+                        created_by_id=user.id,
+                    )
+                )
+        db_session.commit()
+        return user
+
+    return _seed
+
+
+@pytest.fixture
+def auth_headers():
+    """Factory: Authorization headers carrying a token for the given user."""
+    def _auth_headers(user):
+        return {"Authorization": f"Bearer {create_access_token(subject=user.id)}"}
+
+    return _auth_headers
+
+
 @pytest.fixture
 def test_user_data():
     """Sample user data for testing."""
@@ -0,0 +1,48 @@
+def _collect_pages(client, url, headers, limit):
+    """Follow next_cursor until exhaustion, returning ids page by page."""
+    pages = []
+    cursor = None
+    while True:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        pages.append([item["id"] for item in body["items"]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_read_tasks_follows_cursor(client, seed_owner, auth_headers):
+    """Following next_cursor must visit every task exactly once."""
+    user = seed_owner()
+
+    pages = _collect_pages(client, "/api/v1/tasks/", auth_headers(user), limit=30)
+
+    ids = [task_id for page in pages for task_id in page]
+    assert [len(page) for page in pages] == [30, 30, 30, 10]
+    assert len(ids) == len(set(ids)) == 100
+
+
+def test_list_rejects_non_positive_limit(client, seed_owner, auth_headers):
+    """limit=0 must be rejected, not crash computing the next cursor."""
+    user = seed_owner(projects=1, tasks_per_project=1)
+
+    for url in ("/api/v1/tasks/", "/api/v1/projects/"):
+        response = client.get(
+            url, params={"limit": 0}, headers=auth_headers(user)
+        )
+        assert response.status_code == 422
+
+
+def test_read_projects_follows_cursor(client, seed_owner, auth_headers):
+    """Following next_cursor must visit every project exactly once."""
+    user = seed_owner()
+
+    pages = _collect_pages(client, "/api/v1/projects/", auth_headers(user), limit=4)
+
+    ids = [project_id for page in pages for project_id in page]
+    assert [len(page) for page in pages] == [4, 4, 2]
+    assert len(ids) == len(set(ids)) == 10
@@ -0,0 +1,32 @@
+def test_read_projects_query_count(client, seed_owner, auth_headers, assert_max_queries):
+    """Listing 100 projects must not issue one query per row.
+
+    Budget: the current-user lookup plus the project select.
+    """
+    user = seed_owner()
+    # Build headers before counting: reading user.id refreshes the expired
+    # instance, and that test-side query is not part of the request budget.
+    headers = auth_headers(user)
+
+    with assert_max_queries(2):
+        response = client.get("/api/v1/projects/", headers=headers)
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 10
+
+
+def test_read_tasks_query_count(client, seed_owner, auth_headers, assert_max_queries):
+    """Listing 100 tasks stays within the query budget.
+
+    Budget: the current-user lookup plus the task select. The response
+    serializes scalar columns only, so no relationship should ever load;
+    an N+1 regression would issue 100+ queries and fail.
+    """
+    user = seed_owner()
+    headers = auth_headers(user)
+
+    with assert_max_queries(2):
+        response = client.get("/api/v1/tasks/", headers=headers)
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 100